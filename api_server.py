@@ -5,14 +5,23 @@ Response: Only validation result, no price field
 """
 
 import os
+import queue
+import atexit
 import logging
+from logging.handlers import QueueHandler, QueueListener
 import asyncio
-from contextlib import asynccontextmanager
+import hashlib
+import random
+from functools import partial
+from typing import Annotated, Optional
+from contextlib import asynccontextmanager, suppress
 
-import aiohttp
-from fastapi import FastAPI, HTTPException, Request
-from fastapi.responses import HTMLResponse
-from fastapi.openapi.utils import get_openapi
+import httpx
+import orjson
+from aiolimiter import AsyncLimiter
+from cachetools import TTLCache
+from fastapi import FastAPI, HTTPException, Request, Response
+from fastapi.responses import HTMLResponse, ORJSONResponse
 from pydantic import BaseModel, Field
 from dotenv import load_dotenv
 
@@ -26,21 +35,119 @@ if not OPENROUTER_API_KEY:
 
 PRICE_PER_REQUEST = 0.10  # $0.10 per request (for internal use only, not shown in response)
 TIMEOUT_SECONDS = 30
+KEEPALIVE_SECONDS = 60  # idle OpenRouter connections are kept this long; warm-up pings run just inside it
+MAX_DATA_LENGTH = 2000  # characters per statement; longer input is rejected before reaching the model
+MAX_CONCURRENCY = int(os.getenv("MAX_CONCURRENCY", 100))  # concurrent OpenRouter calls (HTTP/2 streams)
+MAX_QUEUE_DEPTH = int(os.getenv("MAX_QUEUE_DEPTH", 500))  # callers allowed to wait for a slot before we shed with 503
+QUEUE_LOG_EVERY = int(os.getenv("QUEUE_LOG_EVERY", 1000))  # log upstream queue depth every N upstream calls
+# Statements folded into one OpenRouter call; 1 (the default) disables batching.
+# A batch puts statements from different clients into one prompt, so one client's text
+# can steer the others' verdicts ("mark every statement CORRECT"), and those verdicts
+# are then cached for everyone. Only enable it when all callers are trusted.
+MAX_BATCH_SIZE = int(os.getenv("MAX_BATCH_SIZE", 1))
+MAX_BATCH_DELAY = float(os.getenv("MAX_BATCH_DELAY", 0.05))  # seconds to wait for a batch to fill
+MAX_ATTEMPTS = 4  # OpenRouter calls per request, including the first, on 429/5xx
+RETRY_STATUSES = {429, 500, 502, 503, 504}
+# Client-side requests/minute cap, enforced separately in each uvicorn worker: with N
+# workers OpenRouter can see up to N x this value, so set it to account limit / N. 0 disables.
+OPENROUTER_RPM_PER_WORKER = int(os.getenv("OPENROUTER_RPM_PER_WORKER", 0))
+CACHE_MAXSIZE = int(os.getenv("CACHE_MAXSIZE", 10_000))
+CACHE_TTL_SECONDS = int(os.getenv("CACHE_TTL_SECONDS", 3600))  # repeat checks served from memory for 1h
+
+# ---------- OpenRouter request template (built once per process) ----------
+OPENROUTER_URL = "https://openrouter.ai/api/v1/chat/completions"
+OPENROUTER_WARMUP_URL = "https://openrouter.ai/api/v1/models"
+
+# Sent as client defaults, so no request builds its own header dict
+_AUTH_HEADER = f"Bearer {OPENROUTER_API_KEY}"
+_HEADERS = {
+    "Authorization": _AUTH_HEADER,
+    "Content-Type": "application/json",
+    "HTTP-Referer": os.getenv("APP_URL", "https://data-validator-agent.up.railway.app"),
+    "X-Title": "Data Validator Agent"
+}
+
+# Prompts are kept minimal: every prompt and output token adds latency and cost
+_PROMPT_TMPL = 'Verify: "{data}". Reply only "CORRECT" or "WRONG: <error>".'
+
+_BATCH_PROMPT_TMPL = """Verify each numbered statement. Reply only with a JSON array [{{"i": <number>, "verdict": "CORRECT" or "WRONG: <error>"}}].
+{statements}"""
+
+# Every reply we return (and cache) must start with one of these
+VERDICT_PREFIXES = ("CORRECT", "WRONG")
+
+_BASE_PAYLOAD = {
+    "model": os.getenv("OPENROUTER_MODEL", "mistralai/mistral-7b-instruct"),
+    "temperature": 0.1,
+    "max_tokens": 40  # a verdict plus a one-line error fits comfortably
+}
 
 # ---------- Logging ----------
-logging.basicConfig(level=logging.INFO)
+# Records are only enqueued on the event loop; a listener thread does the formatting
+# and writing. Production defaults to WARNING so per-request info logs are skipped.
+LOG_LEVEL = os.getenv("LOG_LEVEL", "INFO" if os.getenv("DEBUG", "false").lower() == "true" else "WARNING")
+
+class DeferredQueueHandler(QueueHandler):
+    """Enqueue records unformatted; the stock prepare() would format them on the caller's thread."""
+    def prepare(self, record):
+        return record
+
+_log_queue = queue.SimpleQueue()
+_log_output = logging.StreamHandler()
+_log_output.setFormatter(logging.Formatter(logging.BASIC_FORMAT))
+_log_listener = QueueListener(_log_queue, _log_output)
+logging.basicConfig(level=LOG_LEVEL, handlers=[DeferredQueueHandler(_log_queue)])
+_log_listener.start()
+atexit.register(_log_listener.stop)  # flushes anything still queued; lives as long as the process
 logger = logging.getLogger(__name__)
 
 # ---------- Lifespan for shared session ----------
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     # Startup: create session and semaphore
-    app.state.session = aiohttp.ClientSession()
-    app.state.semaphore = asyncio.Semaphore(100)  # max 100 concurrent outgoing
+    # HTTP/2 client for openrouter.ai: concurrent calls are multiplexed over one
+    # persistent TLS connection instead of each holding (and re-handshaking) a socket.
+    app.state.session = httpx.AsyncClient(
+        http2=True,
+        limits=httpx.Limits(
+            max_connections=2 * MAX_CONCURRENCY,
+            max_keepalive_connections=MAX_CONCURRENCY,
+            keepalive_expiry=KEEPALIVE_SECONDS,
+        ),
+        timeout=httpx.Timeout(TIMEOUT_SECONDS, connect=5.0),
+        headers=_HEADERS,
+    )
+    # Stay below the client's connection limit, so waiting happens here (where
+    # we can see and shed it) rather than inside httpx's pool.
+    app.state.semaphore = asyncio.BoundedSemaphore(MAX_CONCURRENCY)
+    app.state.queue_depth = 0
+    app.state.upstream_calls = 0
+    app.state.rate_limiter = (
+        AsyncLimiter(OPENROUTER_RPM_PER_WORKER, 60) if OPENROUTER_RPM_PER_WORKER > 0 else None
+    )
+    # Pay DNS + TLS now rather than on the first user request, and keep paying it off while idle
+    await warm_connection()
+    app.state.warmer = asyncio.create_task(keep_connection_warm())
+    app.state.cache = TTLCache(maxsize=CACHE_MAXSIZE, ttl=CACHE_TTL_SECONDS)
+    app.state.inflight = {}  # cache key -> running OpenRouter task, shared by duplicate callers
+    app.state.batcher = DynBatcher(max_batch_size=MAX_BATCH_SIZE, max_delay=MAX_BATCH_DELAY)
+    app.state.batcher.start()
+    # Serialize the OpenAPI schema once (FastAPI memoizes the schema dict itself)
+    app.state.openapi_bytes = orjson.dumps(app.openapi())
+    # Read the landing page once here; blocking file I/O has no place in a request handler
+    try:
+        with open("index.html", "rb") as f:
+            app.state.index_html_bytes = f.read()
+    except FileNotFoundError:
+        app.state.index_html_bytes = FALLBACK_INDEX_HTML.encode("utf-8")
     logger.info("🚀 Server starting up...")
     yield
-    # Shutdown: close session
-    await app.state.session.close()
+    # Shutdown: stop batching and warm-up pings, then close session
+    await app.state.batcher.stop()
+    app.state.warmer.cancel()
+    with suppress(asyncio.CancelledError):
+        await app.state.warmer
+    await app.state.session.aclose()
     logger.info("🛑 Server shut down.")
 
 # ---------- FastAPI App ----------
@@ -49,73 +156,331 @@ app = FastAPI(
     description="AI agent that validates data for other AI agents. $0.10 per request.",
     version="1.0.0",
     lifespan=lifespan,
+    default_response_class=ORJSONResponse,
     docs_url="/docs",
     redoc_url="/redoc",
 )
 
 # ---------- Pydantic Models ----------
 class DataRequest(BaseModel):
-    data: str = Field(..., description="The data to validate", example="Bitcoin price is $100,000")
+    data: str = Field(..., min_length=1, max_length=MAX_DATA_LENGTH,
+                      description="The data to validate", example="Bitcoin price is $100,000")
 
 class DataResponse(BaseModel):
     result: str = Field(..., description="Validation result (CORRECT or WRONG with explanation)")
     # price field removed - RapidAPI handles pricing
 
+DataItem = Annotated[str, Field(min_length=1, max_length=MAX_DATA_LENGTH)]
+
+class BatchRequest(BaseModel):
+    items: list[DataItem] = Field(..., max_length=100, description="Up to 100 data items to validate",
+                                  example=["Bitcoin price is $100,000", "Water boils at 100°C at sea level"])
+
+class BatchItemResult(BaseModel):
+    result: Optional[str] = Field(None, description="Validation result (CORRECT or WRONG with explanation)")
+    error: Optional[str] = Field(None, description="Why this item could not be validated")
+
+class BatchResponse(BaseModel):
+    results: list[BatchItemResult] = Field(..., description="One entry per item, in request order")
+
+# ---------- Helper: Cache key ----------
+def cache_key(data: str) -> bytes:
+    """Hash of the normalized statement, so trivial case/whitespace variants share one entry."""
+    return hashlib.blake2b(data.strip().lower().encode(), digest_size=16).digest()
+
+# ---------- Helper: Upstream concurrency slot ----------
+@asynccontextmanager
+async def upstream_slot():
+    """Hold one OpenRouter slot; fail fast with 503 when too many callers are already waiting."""
+    semaphore = app.state.semaphore
+    if semaphore.locked() and app.state.queue_depth >= MAX_QUEUE_DEPTH:
+        logger.warning("Upstream queue full (%d waiting), shedding request", app.state.queue_depth)
+        raise HTTPException(status_code=503, detail="Server busy, please retry", headers={"Retry-After": "1"})
+
+    app.state.upstream_calls += 1
+    if app.state.upstream_calls % QUEUE_LOG_EVERY == 0:
+        # WARNING so the sample still shows up at the production default log level
+        logger.warning("Upstream queue depth: %d waiting", app.state.queue_depth)
+
+    app.state.queue_depth += 1
+    try:
+        await semaphore.acquire()
+    finally:
+        app.state.queue_depth -= 1
+    try:
+        yield
+    finally:
+        semaphore.release()
+
+# ---------- Helper: Warm OpenRouter connection ----------
+async def warm_connection():
+    """Open (or touch) the pooled connection to openrouter.ai; the response itself is ignored."""
+    try:
+        await app.state.session.head(OPENROUTER_WARMUP_URL, timeout=5)
+    except httpx.HTTPError as e:
+        logger.warning("OpenRouter warm-up failed: %s", e)
+
+async def keep_connection_warm():
+    while True:
+        await asyncio.sleep(KEEPALIVE_SECONDS - 5)
+        await warm_connection()
+
 # ---------- Helper: Call OpenRouter ----------
-async def check_data(data: str) -> str:
-    url = "https://openrouter.ai/api/v1/chat/completions"
-    headers = {
-        "Authorization": f"Bearer {OPENROUTER_API_KEY}",
-        "Content-Type": "application/json",
-        "HTTP-Referer": os.getenv("APP_URL", "https://data-validator-agent.up.railway.app"),
-        "X-Title": "Data Validator Agent"
-    }
-    
-    # 🔥 FIXED PROMPT - More precise and focused
-    prompt = f"""You are an expert fact-checker. Verify the given statement for factual accuracy ONLY.
-Do NOT add extra information, context, or related facts unless directly relevant to verifying the statement.
-If the statement is accurate, reply with "CORRECT".
-If it is inaccurate, reply with "WRONG: [specific error]".
-Keep your answer concise and limited to the statement itself.
-
-Statement: {data}"""
-    
-    payload = {
-        "model": "mistralai/mixtral-8x7b-instruct",
-        "messages": [{"role": "user", "content": prompt}],
-        "temperature": 0.1,
-        "max_tokens": 150  # Reduced tokens to save credits
-    }
-    
-    async with app.state.semaphore:
+async def read_stream(resp: httpx.Response, stop_at_verdict: bool) -> str:
+    """Accumulate the reply text from OpenRouter's SSE frames.
+
+    With stop_at_verdict, return as soon as a CORRECT/WRONG line is complete;
+    leaving the stream early also stops the model generating (and billing) the rest.
+    """
+    parts = []
+    async for line in resp.aiter_lines():
+        # skip blank separators and ": OPENROUTER PROCESSING" keep-alive comments
+        if not line.startswith("data:"):
+            continue
+        frame = line[5:].strip()
+        if frame == "[DONE]":
+            break
         try:
-            async with app.state.session.post(url, headers=headers, json=payload, timeout=TIMEOUT_SECONDS) as resp:
-                if resp.status != 200:
-                    text = await resp.text()
-                    logger.error(f"OpenRouter error {resp.status}: {text[:200]}")
-                    if resp.status == 401:
+            chunk = orjson.loads(frame)
+        except orjson.JSONDecodeError:
+            logger.error("Malformed OpenRouter stream frame: %s", frame[:200])
+            raise HTTPException(status_code=502, detail="AI service error")
+        if "error" in chunk:
+            logger.error("OpenRouter stream error: %s", chunk["error"])
+            raise HTTPException(status_code=502, detail="AI service error")
+        if not chunk.get("choices"):
+            continue
+        delta = chunk["choices"][0].get("delta", {}).get("content")
+        if not delta:
+            continue
+        parts.append(delta)
+        if stop_at_verdict and "\n" in delta:
+            text = "".join(parts).lstrip()
+            if text.startswith(VERDICT_PREFIXES) and "\n" in text:
+                return text.split("\n", 1)[0].strip()
+    return "".join(parts).strip()
+
+def backoff_delay(attempt: int, retry_after: Optional[str]) -> float:
+    """Seconds to wait before the next attempt: Retry-After if given, else capped exponential with jitter."""
+    if retry_after:
+        try:
+            return max(float(retry_after), 0.0)
+        except ValueError:
+            pass  # HTTP-date form; fall back to our own schedule
+    return min(0.25 * 2 ** attempt + random.random() * 0.25, 4.0)
+
+async def post_chat(payload: dict, stop_at_verdict: bool = False, deadline: Optional[float] = None) -> str:
+    """Send one streamed chat completion to OpenRouter and return the reply text.
+
+    Transient 429/5xx replies are retried with backoff. The whole call, retries
+    included, is bounded by TIMEOUT_SECONDS: httpx's timeout only covers each
+    connect/read step, and streamed keep-alive comments keep resetting the read timer.
+    Pass deadline (loop time) to share one budget across several calls.
+    """
+    body = orjson.dumps({**payload, "stream": True})
+    loop = asyncio.get_running_loop()
+    if deadline is None:
+        deadline = loop.time() + TIMEOUT_SECONDS
+    try:
+        async with asyncio.timeout_at(deadline):
+            for attempt in range(MAX_ATTEMPTS):
+                # Rate-limit waits and backoff sleeps happen outside upstream_slot(),
+                # so a slot is only held while a request is actually on the wire.
+                if app.state.rate_limiter is not None:
+                    await app.state.rate_limiter.acquire()
+                async with upstream_slot():
+                    async with app.state.session.stream("POST", OPENROUTER_URL, content=body) as resp:
+                        if resp.status_code == 200:
+                            return await read_stream(resp, stop_at_verdict)
+                        text = (await resp.aread()).decode(errors="replace")
+                delay = backoff_delay(attempt, resp.headers.get("Retry-After"))
+                if (resp.status_code not in RETRY_STATUSES or attempt + 1 == MAX_ATTEMPTS
+                        or loop.time() + delay >= deadline):
+                    logger.error("OpenRouter error %s: %s", resp.status_code, text[:200])
+                    if resp.status_code == 401:
                         raise HTTPException(status_code=502, detail="OpenRouter API key invalid or disabled")
-                    if resp.status == 402:
+                    if resp.status_code == 402:
                         raise HTTPException(status_code=402, detail="Insufficient credits. Please add funds to OpenRouter.")
                     raise HTTPException(status_code=502, detail="AI service error")
-                result = await resp.json()
-                return result['choices'][0]['message']['content'].strip()
-        except asyncio.TimeoutError:
-            logger.error("OpenRouter timeout")
-            raise HTTPException(status_code=504, detail="AI service timeout")
-        except aiohttp.ClientError as e:
-            logger.error(f"Network error: {str(e)}")
-            raise HTTPException(status_code=503, detail="AI service unavailable")
+                logger.warning("OpenRouter %s, retrying in %.2fs (attempt %d/%d)",
+                               resp.status_code, delay, attempt + 1, MAX_ATTEMPTS)
+                await asyncio.sleep(delay)
+    except (TimeoutError, httpx.TimeoutException):
+        logger.error("OpenRouter timeout")
+        raise HTTPException(status_code=504, detail="AI service timeout")
+    except httpx.HTTPError as e:
+        logger.error("Network error: %s", e)
+        raise HTTPException(status_code=503, detail="AI service unavailable")
 
-# ---------- Landing Page (Custom HTML) ----------
-@app.get("/", response_class=HTMLResponse, include_in_schema=False)
-async def home():
-    """Custom landing page for the agent"""
+async def call_openrouter(data: str, deadline: Optional[float] = None) -> str:
+    payload = {
+        **_BASE_PAYLOAD,
+        "messages": [{"role": "user", "content": _PROMPT_TMPL.format(data=data)}],
+        "stop": ["\n\n"],
+    }
+    verdict = await post_chat(payload, stop_at_verdict=True, deadline=deadline)
+    # empty or chatty replies would otherwise be cached and served for CACHE_TTL_SECONDS
+    if not verdict.startswith(VERDICT_PREFIXES):
+        logger.error("OpenRouter reply is not a verdict: %s", verdict[:200])
+        raise HTTPException(status_code=502, detail="AI service error")
+    return verdict
+
+async def call_openrouter_batch(items: list[str]) -> list:
+    """Validate several statements with one prompt; items the model skips are checked on their own.
+
+    The batch call and any single re-checks share one TIMEOUT_SECONDS budget. A failed
+    re-check is returned as that item's exception, so the other verdicts still count.
+    """
+    deadline = asyncio.get_running_loop().time() + TIMEOUT_SECONDS
+    statements = "\n".join(f"{i}. {orjson.dumps(data).decode()}" for i, data in enumerate(items))
+    payload = {
+        **_BASE_PAYLOAD,
+        "max_tokens": (_BASE_PAYLOAD["max_tokens"] + 10) * len(items),  # + JSON framing per item
+        "messages": [{"role": "user", "content": _BATCH_PROMPT_TMPL.format(statements=statements)}],
+    }
+    content = await post_chat(payload, deadline=deadline)
+
+    verdicts = {}
     try:
-        with open("index.html", "r", encoding="utf-8") as f:
-            return f.read()
-    except FileNotFoundError:
-        return """
+        # tolerate prose or code fences around the array
+        for entry in orjson.loads(content[content.index("["):content.rindex("]") + 1]):
+            verdict = str(entry["verdict"]).strip()
+            # anything else is a hallucinated or garbled verdict; re-check it singly rather than cache it
+            if verdict.startswith(VERDICT_PREFIXES):
+                verdicts[int(entry["i"])] = verdict
+    except (ValueError, TypeError, KeyError, orjson.JSONDecodeError):
+        pass
+    if not verdicts:
+        # re-checking every item singly would cost more than not batching at all
+        logger.error("Unusable batch reply: %s", content[:200])
+        raise HTTPException(status_code=502, detail="AI service error")
+
+    missing = [i for i in range(len(items)) if not verdicts.get(i)]
+    if missing:
+        singles = await asyncio.gather(*(call_openrouter(items[i], deadline) for i in missing),
+                                       return_exceptions=True)
+        verdicts.update(zip(missing, singles))
+    return [verdicts[i] for i in range(len(items))]
+
+# ---------- Dynamic batcher ----------
+class DynBatcher:
+    """Folds concurrently arriving statements into one OpenRouter call.
+
+    A background task drains the queue and flushes once max_batch_size items
+    are pending or max_delay seconds have passed since the first one arrived.
+    A statement that arrives while the batcher is idle is sent straight away.
+    """
+
+    def __init__(self, max_batch_size: int, max_delay: float):
+        self.max_batch_size = max_batch_size
+        self.max_delay = max_delay
+        self.queue: asyncio.Queue = asyncio.Queue()
+        self._worker = None
+        self._flushes = set()
+
+    def start(self):
+        self._worker = asyncio.create_task(self._run())
+
+    async def stop(self):
+        self._worker.cancel()
+        with suppress(asyncio.CancelledError):
+            await self._worker
+        for flush in list(self._flushes):
+            flush.cancel()
+        await asyncio.gather(*self._flushes, return_exceptions=True)
+        while not self.queue.empty():
+            _, fut = self.queue.get_nowait()
+            fut.cancel()
+
+    async def submit(self, data: str) -> str:
+        if self.max_batch_size <= 1:
+            return await call_openrouter(data)
+        fut = asyncio.get_running_loop().create_future()
+        self.queue.put_nowait((data, fut))
+        return await fut
+
+    async def _run(self):
+        loop = asyncio.get_running_loop()
+        while True:
+            batch = [await self.queue.get()]
+            if self.queue.empty() and not self._flushes:
+                # nothing else queued or upstream: waiting would only add latency
+                self._start_flush(batch)
+                continue
+            deadline = loop.time() + self.max_delay
+            while len(batch) < self.max_batch_size:
+                remaining = deadline - loop.time()
+                if remaining <= 0:
+                    break
+                try:
+                    batch.append(await asyncio.wait_for(self.queue.get(), remaining))
+                except asyncio.TimeoutError:
+                    break
+            self._start_flush(batch)
+
+    def _start_flush(self, batch: list):
+        # flush in the background so the next batch can start filling right away
+        flush = asyncio.create_task(self._flush(batch))
+        self._flushes.add(flush)
+        flush.add_done_callback(self._flushes.discard)
+
+    async def _flush(self, batch: list):
+        items = [data for data, _ in batch]
+        try:
+            if len(items) == 1:
+                results = [await call_openrouter(items[0])]
+            else:
+                results = await call_openrouter_batch(items)
+        except asyncio.CancelledError:
+            for _, fut in batch:
+                fut.cancel()
+            raise
+        except Exception as e:
+            for _, fut in batch:
+                if not fut.done():
+                    fut.set_exception(e)
+            return
+        for (_, fut), result in zip(batch, results):
+            if fut.done():
+                continue
+            if isinstance(result, BaseException):
+                fut.set_exception(result)
+            else:
+                fut.set_result(result)
+
+# ---------- Helper: Cached, single-flight validation ----------
+def _on_upstream_done(key: bytes, task: asyncio.Task):
+    app.state.inflight.pop(key, None)
+    if not task.cancelled() and task.exception() is None:
+        app.state.cache[key] = task.result()
+
+async def check_data(data: str) -> str:
+    """Validate data, reusing cached results and any identical call already in flight.
+
+    I/O-bound path only: the one slow step is the awaited OpenRouter call. The
+    synchronous work around it (blake2b cache key, prompt .format(), orjson) takes
+    microseconds and stays inline on the event loop. Do not wrap it in
+    run_in_executor/to_thread - thread-pool queueing would cost more than the work.
+    """
+    data = data.strip()
+    if not data:
+        raise HTTPException(status_code=400, detail="Data must not be empty")
+
+    key = cache_key(data)
+    cached = app.state.cache.get(key)
+    if cached is not None:
+        return cached
+
+    task = app.state.inflight.get(key)
+    if task is None:
+        task = asyncio.create_task(app.state.batcher.submit(data))
+        task.add_done_callback(partial(_on_upstream_done, key))
+        app.state.inflight[key] = task
+    # shield: one caller disconnecting must not cancel the call the others are waiting on
+    return await asyncio.shield(task)
+
+# ---------- Landing Page (Custom HTML) ----------
+FALLBACK_INDEX_HTML = """
         <html>
             <body>
                 <h1>Data Validator Agent</h1>
@@ -125,35 +490,60 @@ async def home():
         </html>
         """
 
+@app.get("/", response_class=HTMLResponse, include_in_schema=False)
+async def home():
+    """Custom landing page for the agent (loaded once at startup)"""
+    return Response(content=app.state.index_html_bytes, media_type="text/html")
+
 # ---------- API Endpoints ----------
 @app.get("/health", include_in_schema=False)
 async def health():
     """Health check endpoint"""
     return {"status": "healthy"}
 
-@app.post("/check", response_model=DataResponse)
+# Responses are plain dicts; the models below only document them in OpenAPI
+@app.post("/check", responses={200: {"model": DataResponse}})
 async def check_data_endpoint(request: DataRequest):
     """Validate the provided data."""
     try:
         result = await check_data(request.data)
-        logger.info(f"Request: {request.data[:50]}... Result: {result[:50]}...")
-        return DataResponse(result=result)
+        logger.info("Request: %s... Result: %s...", request.data[:50], result[:50])
+        return ORJSONResponse({"result": result})
     except HTTPException:
         raise
     except Exception as e:
-        logger.error(f"Unexpected error: {str(e)}", exc_info=True)
+        logger.error("Unexpected error: %s", e, exc_info=True)
         raise HTTPException(status_code=500, detail="Internal server error")
 
+@app.post("/check-batch", responses={200: {"model": BatchResponse}})
+async def check_batch_endpoint(request: BatchRequest):
+    """Validate several data items in one call; failures are reported per item."""
+    # duplicates within the batch collapse onto one upstream call in check_data
+    outcomes = await asyncio.gather(*(check_data(d) for d in request.items), return_exceptions=True)
+    results = []
+    for outcome in outcomes:
+        if isinstance(outcome, HTTPException):
+            results.append({"result": None, "error": outcome.detail})
+        elif isinstance(outcome, BaseException):
+            logger.error("Unexpected error: %s", outcome, exc_info=outcome)
+            results.append({"result": None, "error": "Internal server error"})
+        else:
+            results.append({"result": outcome, "error": None})
+    logger.info("Batch request: %d items", len(request.items))
+    return ORJSONResponse({"results": results})
+
 # ---------- OpenAPI JSON ----------
 @app.get("/openapi.json", include_in_schema=False)
 async def get_openapi_json():
     """Return OpenAPI specification in JSON format."""
-    return get_openapi(
-        title=app.title,
-        version=app.version,
-        description=app.description,
-        routes=app.routes,
-    )
+    return Response(content=app.state.openapi_bytes, media_type="application/json")
+
+# FastAPI's constructor registers its own /openapi.json route (re-encoding the schema with
+# stdlib json on every call) ahead of ours; drop it so the precomputed bytes are served.
+app.router.routes[:] = [
+    route for route in app.router.routes
+    if not (getattr(route, "path", None) == app.openapi_url and route.name == "openapi")
+]
 
 # ---------- Terms of Service (HTML) ----------
 TERMS_HTML = """
@@ -186,18 +576,29 @@ TERMS_HTML = """
 </body>
 </html>
 """
+_TERMS_BYTES = TERMS_HTML.encode("utf-8")
 
 @app.get("/terms", response_class=HTMLResponse, include_in_schema=False)
 async def terms():
-    return TERMS_HTML
+    return Response(
+        content=_TERMS_BYTES,
+        media_type="text/html",
+        headers={"Cache-Control": "public, max-age=86400"},
+    )
 
 # ---------- Run (for local development) ----------
 if __name__ == "__main__":
     import uvicorn
     port = int(os.getenv("PORT", 8000))
+    debug = os.getenv("DEBUG", "false").lower() == "true"
     uvicorn.run(
         "api_server:app",
         host="0.0.0.0",
         port=port,
-        reload=os.getenv("DEBUG", "false").lower() == "true"
+        reload=debug,
+        workers=1 if debug else int(os.getenv("WEB_CONCURRENCY", os.cpu_count() or 1)),  # reload needs a single worker
+        loop="uvloop",
+        http="httptools",
+        log_level="info" if debug else "warning",
+        access_log=debug,  # one synchronous write per request; keep it out of production
     )